@@ -1,8 +1,97 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import base64
+import binascii
+import copy
+from collections import deque
+import ipaddress
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
+from urllib.parse import urlsplit, parse_qs, urlencode, urljoin
 from bluecat_bam_tools.exceptions import *
-from typing import Union, List, Dict
+from typing import Union, List, Dict, Iterator, Tuple
+
+# orjson is an optional speedup for parsing large paginated responses and encoding request bodies.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch the same exception either way.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+
+@dataclass
+class _CircuitBreaker:
+    """
+    Minimal in-process circuit breaker guarding calls to the BAM server.
+
+    After `failure_threshold` consecutive failures the circuit opens, and calls fail fast with CircuitOpenError
+    until `recovery_seconds` have elapsed. The next call is then let through as a probe (half-open): success closes
+    the circuit again, failure re-opens it for another recovery window.
+
+    The breaker is shared by every thread using the client, so a down server trips it once for all of them. Each
+    state change starts a new generation; a result reported for an older generation (e.g. a slow request that was
+    already in flight when the circuit opened) is ignored, so it can't flip the state the other threads now rely on.
+    While half-open, only one probe is let through at a time.
+    """
+    failure_threshold: int = 5
+    recovery_seconds: float = 30.0
+    state: str = "CLOSED"
+    failures: int = 0
+    opened_at: float = 0.0
+    generation: int = 0
+    probing: bool = False
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def before_call(self) -> int:
+        """Raises CircuitOpenError if the call should fail fast, otherwise returns the generation to report back."""
+        with self._lock:
+            if self.state == "OPEN":
+                remaining = self.recovery_seconds - (time.monotonic() - self.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(f"BAM server unavailable after {self.failures} consecutive failures; "
+                                           f"retrying in {remaining:.0f} seconds")
+                self._transition("HALF_OPEN")
+            if self.state == "HALF_OPEN":
+                if self.probing:
+                    raise CircuitOpenError("BAM server unavailable; waiting on a probe request to recover")
+                self.probing = True
+            return self.generation
+
+    def after_call(self, generation: int, ok: bool) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+            if ok:
+                self.failures = 0
+                if self.state != "CLOSED":
+                    self._transition("CLOSED")
+                return
+            self.failures += 1
+            if self.state == "HALF_OPEN" or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._transition("OPEN")
+
+    def release(self, generation: int) -> None:
+        """Reports a call that ended without saying anything about the server, freeing the half-open probe slot."""
+        with self._lock:
+            if generation == self.generation:
+                self.probing = False
+
+    def _transition(self, state: str) -> None:
+        # caller holds the lock
+        self.state = state
+        self.generation += 1
+        self.probing = False
+
 
 class BluecatClient:
     """
@@ -12,7 +101,25 @@ class BluecatClient:
     query network information, and manage IP addresses and related resources.
     """
 
-    def __init__(self, hostname: str, username: str, password: str, verify_ssl: bool = True):
+    _BASE_HEADERS = {
+        "Content-Type": "application/hal+json",
+        "Accept": "application/hal+json"
+    }
+
+    # Maps exceptions raised during login() to friendly LoginError messages. The first matching entry wins, so
+    # subclasses must come before their parents (e.g. HTTPError before RequestException).
+    _LOGIN_ERROR_MAP = [
+        (CircuitOpenError, lambda e: str(e)),
+        (requests.exceptions.ConnectionError, lambda e: "Unable to connect to the server"),
+        (requests.exceptions.Timeout, lambda e: "Request timed out"),
+        (requests.exceptions.HTTPError, lambda e: f"HTTP error occurred: {e.response.status_code} - {e.response.reason}"),
+        (requests.exceptions.RequestException, lambda e: f"An unexpected error occurred: {e}"),
+        (json.JSONDecodeError, lambda e: f"Error decoding JSON response: {e}"),
+    ]
+
+    def __init__(self, hostname: str, username: str, password: str, verify_ssl: bool = True, pool_maxsize: int = 50,
+                 connect_timeout: float = 5.0, read_timeout: float = 30.0, page_size: int = 1000,
+                 page_workers: int = 8, max_retries: Union[int, Retry, None] = None):
         """
         Initialize the Bluecat client.
 
@@ -21,6 +128,17 @@ class BluecatClient:
             username (str): Username for authentication
             password (str): Password for authentication
             verify_ssl (bool): Whether to verify SSL certificates, defaults to True
+            pool_maxsize (int): Maximum number of keep-alive connections kept open to the server, defaults to 50. This
+                also caps how many requests the client has in flight at once, across all threads.
+            connect_timeout (float): Seconds to wait for a connection to the server, defaults to 5
+            read_timeout (float): Seconds to wait for the server to send a response, defaults to 30
+            page_size (int): Number of objects requested per page when paginating, defaults to 1000
+            page_workers (int): Maximum number of pages fetched concurrently when paginating, defaults to 8. Set to 1 to
+                fetch pages strictly one after another.
+            max_retries (int | urllib3.util.Retry | None): Retry policy for requests to the server. Defaults to None,
+                which retries idempotent requests on transient errors (see below). Pass 0 to disable retries, or a
+                urllib3 Retry object for full control. Its raise_on_status is always treated as False, so a request that
+                still fails after its retries returns the last response, and raise_for_status() raises HTTPError.
         """
         if not isinstance(hostname, str):
             raise TypeError("hostname must be a string")
@@ -30,23 +148,97 @@ class BluecatClient:
             raise TypeError("password must be a string")
         if not isinstance(verify_ssl, bool):
             raise TypeError("verify_ssl must be a boolean")
+        if isinstance(pool_maxsize, bool) or not isinstance(pool_maxsize, int):
+            raise TypeError("pool_maxsize must be an integer")
+        if pool_maxsize < 1:
+            raise ValueError("pool_maxsize must be at least 1")
+        if isinstance(connect_timeout, bool) or not isinstance(connect_timeout, (int, float)):
+            raise TypeError("connect_timeout must be a number")
+        if connect_timeout <= 0:
+            raise ValueError("connect_timeout must be greater than 0")
+        if isinstance(read_timeout, bool) or not isinstance(read_timeout, (int, float)):
+            raise TypeError("read_timeout must be a number")
+        if read_timeout <= 0:
+            raise ValueError("read_timeout must be greater than 0")
+        if isinstance(page_size, bool) or not isinstance(page_size, int):
+            raise TypeError("page_size must be an integer")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        if isinstance(page_workers, bool) or not isinstance(page_workers, int):
+            raise TypeError("page_workers must be an integer")
+        if page_workers < 1:
+            raise ValueError("page_workers must be at least 1")
+        if max_retries is not None and (isinstance(max_retries, bool) or not isinstance(max_retries, (int, Retry))):
+            raise TypeError("max_retries must be an integer, a urllib3 Retry object, or None")
+        if isinstance(max_retries, int) and max_retries < 0:
+            raise ValueError("max_retries must not be negative")
 
         self.hostname = hostname
         self.username = username
         self.password = password
         self.verify_ssl = verify_ssl
+        self.pool_maxsize = pool_maxsize
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.page_size = page_size
+        self.page_workers = page_workers
         self.api_token = None
         self.url_base = f"https://{self.hostname}"
         self.url_api_path = "/api/v2"
+        self._url_root = f"{self.url_base}/"
+        self._url_base_api = f"{self.url_base}{self.url_api_path}/"
+        self._url_api_prefix = f"{self.url_api_path.lstrip('/')}/"
         self.headers = None
+        self._auth_header = None
         self.logged_in = False
-        self.session = None
+        self._circuit_breaker = _CircuitBreaker()
+        # Thread pools nest (e.g. several network scans, each fetching pages concurrently), so they can't bound the
+        # number of requests in flight on their own. This caps it client-wide at the size of the connection pool, so
+        # no request has to open a connection that the pool then throws away.
+        self._request_slots = threading.BoundedSemaphore(pool_maxsize)
+        self._network_cache: Dict[str, Dict] = {}
+        self._zone_cache: Dict[str, List[Dict]] = {}
+
+        # One session for the lifetime of the client, so the login POST and every later call share one pool of
+        # keep-alive connections, including across logout() and login() again. It is closed by __exit__().
+        self.session = requests.Session()
+        self.session.verify = self.verify_ssl
+        self.session.headers.update(self._BASE_HEADERS)
+
+        # By default, retry transient server errors with exponential backoff, but only for idempotent methods. The
+        # login POST, record creation POSTs, and logout PATCH are never retried. raise_on_status=False hands the last
+        # response back to us, so raise_for_status() still raises the usual HTTPError when the retries are exhausted.
+        if max_retries is None:
+            retry_kwargs = dict(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+            try:
+                # Jitter keeps clients that failed together from retrying in lockstep
+                max_retries = Retry(backoff_jitter=0.3, **retry_kwargs)
+            except TypeError:
+                # urllib3 < 2 has no backoff_jitter; plain exponential backoff still works
+                max_retries = Retry(**retry_kwargs)
+        elif isinstance(max_retries, Retry) and max_retries.raise_on_status:
+            # Same for a caller's policy: hand back the last response rather than raising RetryError
+            max_retries = max_retries.new(raise_on_status=False)
+        # The client only ever talks to one host, so a single per-host pool of pool_maxsize connections is enough.
+        # Mounting on our own URL prefix leaves any other host with the default adapter and no retries.
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize, max_retries=max_retries)
+        self.session.mount(self._url_root, adapter)
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.logout()
+        try:
+            self.logout()
+        finally:
+            self.session.close()
 
     def _handle_login_exception(self, exc, message, debug):
         if debug:
@@ -54,6 +246,66 @@ class BluecatClient:
         else:
             raise LoginError(message)
 
+    def _resolve_url(self, path_or_url: str) -> str:
+        """
+        Turns an endpoint path into an absolute URL. Accepts 'networks', '/networks', '/api/v2/networks', '/api/v2'
+        (the API root), or an absolute URL on the BAM server (e.g. a pagination link), which is returned unchanged.
+
+        Raises ValueError for an absolute URL on any other host or scheme, since requests carry the session's
+        Authorization header.
+        """
+        parts = urlsplit(path_or_url)
+        if parts.scheme or parts.netloc:
+            if parts.scheme.lower() != 'https' or parts.netloc.lower() != self.hostname.lower():
+                raise ValueError(f"Refusing to send a request for {path_or_url} outside of {self.url_base}")
+            return path_or_url
+
+        path = path_or_url.lstrip('/')
+        api_root = self._url_api_prefix.rstrip('/')
+        if path == api_root or path.startswith(f"{api_root}?"):
+            path = self._url_api_prefix + path[len(api_root):]
+        if path.startswith(self._url_api_prefix):
+            return urljoin(self._url_root, path)
+        return urljoin(self._url_base_api, path)
+
+    def _call(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a request through the session, guarded by the circuit breaker. Connection errors, timeouts, and 5xx
+        responses count as failures; anything else (including 4xx) counts as success, because the server answered.
+
+        Every request gets the (connect, read) timeout from the constructor unless `timeout` is passed explicitly.
+        """
+        # verify is passed per call, not just set on the session: requests lets REQUESTS_CA_BUNDLE / CURL_CA_BUNDLE
+        # override session.verify, which would silently re-enable verification when verify_ssl=False.
+        kwargs.setdefault("verify", self.verify_ssl)
+        return self._guarded(self.session.request, method, url, **kwargs)
+
+    def _send(self, prepared: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """
+        Like `_call()`, but sends an already prepared request. Unlike `session.request()`, `session.send()` doesn't
+        merge environment settings (proxies, REQUESTS_CA_BUNDLE), so callers pass those in, typically computed once
+        with `session.merge_environment_settings()`.
+        """
+        return self._guarded(self.session.send, prepared, **kwargs)
+
+    def _guarded(self, send, *args, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", (self.connect_timeout, self.read_timeout))
+        generation = self._circuit_breaker.before_call()
+        try:
+            with self._request_slots:
+                response = send(*args, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.RetryError):
+            # RetryError means the server kept failing until the retries ran out
+            self._circuit_breaker.after_call(generation, False)
+            raise
+        except BaseException:
+            # not the server's fault (e.g. a bad argument or KeyboardInterrupt); don't count it either way
+            self._circuit_breaker.release(generation)
+            raise
+
+        self._circuit_breaker.after_call(generation, response.status_code < 500)
+        return response
+
     def login(self, debug: bool = False) -> bool:
         """
         Attempts to create a session on the BAM server using credentials provided in the constructor.
@@ -69,6 +321,8 @@ class BluecatClient:
 
         Raises:
             bluecat_bam_tools.exceptions.LoginError: When debug=False and login fails for any reason
+            bluecat_bam_tools.exceptions.CircuitOpenError: When debug=True and recent calls to the server have failed
+                repeatedly, so the call was not attempted
             requests.exceptions.ConnectionError: When debug=True and unable to connect to the server
             requests.exceptions.Timeout: When debug=True and request times out
             requests.exceptions.HTTPError: When debug=True and the server returns an HTTP error status code
@@ -77,49 +331,35 @@ class BluecatClient:
         """
         try:
             url = f"{self.url_base}{self.url_api_path}/sessions"
-            self.headers = {
-                "Content-Type": "application/hal+json",
-                "Accept": "application/hal+json"
-            }
             data = {
                 "username": self.username,
                 "password": self.password
             }
 
-            response = requests.post(url, headers=self.headers, data=json.dumps(data), verify=self.verify_ssl)
+            response = self._call("POST", url, data=_json_dumps(data))
             response.raise_for_status()
 
-            response_data = response.json()
+            response_data = _json_loads(response.content)
             self.api_token = response_data.get("apiToken")
 
             if self.api_token is None:
                 return False
 
-            credentials = f"{self.username}:{self.api_token}"
-            credentials_bytes = credentials.encode()  # convert str to bytes string
-            credentials_b64_bytes = base64.b64encode(credentials_bytes)  # still a bytes string
-            credentials_b64 = credentials_b64_bytes.decode()  # Now we have a base64 string
-
-            self.headers = {
-                "Content-Type": "application/hal+json",
-                "Authorization": f"Basic {credentials_b64}",
-                "Accept": "application/hal+json"
-            }
+            # The Authorization header is built once per API token and reused by every call on the session.
+            # binascii.b2a_base64 is what base64.b64encode calls under the hood, minus the wrapper and newline strip.
+            credentials_bytes = f"{self.username}:{self.api_token}".encode()
+            credentials_b64 = binascii.b2a_base64(credentials_bytes, newline=False).decode('ascii')
+            self._auth_header = f"Basic {credentials_b64}"
 
-            self.session = requests.Session()
-            self.session.headers.update(self.headers)
+            self.session.headers["Authorization"] = self._auth_header
+            self.headers = {**self._BASE_HEADERS, "Authorization": self._auth_header}
 
             self.logged_in = True
-        except requests.exceptions.ConnectionError as e:
-            self._handle_login_exception(e, "Unable to connect to the server", debug)
-        except requests.exceptions.Timeout as e:
-            self._handle_login_exception(e, "Request timed out", debug)
-        except requests.exceptions.HTTPError as e:
-            self._handle_login_exception(e, f"HTTP error occurred: {e.response.status_code} - {e.response.reason}", debug)
-        except requests.exceptions.RequestException as e:
-            self._handle_login_exception(e, f"An unexpected error occurred: {e}", debug)
-        except json.JSONDecodeError as e:
-            self._handle_login_exception(e, f"Error decoding JSON response: {e}", debug)
+        except Exception as e:
+            for exc_type, message in self._LOGIN_ERROR_MAP:
+                if isinstance(e, exc_type):
+                    self._handle_login_exception(e, message(e), debug)
+            raise
 
         return True
 
@@ -128,30 +368,33 @@ class BluecatClient:
         This method is automatically called by the `__exit__()` method, so you only need to call `logout()` explicitly
         if you're **not** using a `with` block.
 
+        The client's pooled connections stay open, so you may `login()` again. Leaving the `with` block closes them.
+
         Returns:
             None
 
         Raises:
+            bluecat_bam_tools.exceptions.CircuitOpenError: If recent calls to the server have failed repeatedly
             requests.exceptions.HTTPError: If the server returns an error response
         """
-        if self.session and self.logged_in:
+        if self.logged_in:
             url = f"{self.url_base}{self.url_api_path}/sessions/current"
 
-            local_headers = self.session.headers.copy()
-            local_headers.update({
-                "Content-Type": "application/merge-patch+json",
-                "x-bcn-change-control-comment": "Logging out"
-            })
-
-            response = self.session.patch(
+            # requests merges per-call headers over the session headers, so only pass the ones that differ
+            response = self._call(
+                "PATCH",
                 url,
-                json={"state": "LOGGED_OUT"},
-                headers=local_headers,
-                verify=self.verify_ssl
+                data=_json_dumps({"state": "LOGGED_OUT"}),
+                headers={
+                    "Content-Type": "application/merge-patch+json",
+                    "x-bcn-change-control-comment": "Logging out"
+                }
             )
             response.raise_for_status()
-            self.session.close()
+            self.session.headers.pop("Authorization", None)
             self.logged_in = False
+            self._network_cache.clear()
+            self._zone_cache.clear()
 
     def http_get_limited(self, endpoint_path: str) -> dict:
         """
@@ -165,95 +408,196 @@ class BluecatClient:
             dict: The raw JSON response from the API as a dictionary
 
         Raises:
+            ValueError: If given an absolute URL that is not on the BAM server
             RuntimeError: If called before logging in
+            bluecat_bam_tools.exceptions.CircuitOpenError: If recent calls to the server have failed repeatedly
             requests.exceptions.HTTPError: If the server returns an error response
         """
         if not self.logged_in:
             raise RuntimeError("You must call login() before using this method.")
 
-        if not endpoint_path.startswith('/'):
-            endpoint_path = f"/{endpoint_path}"
+        url = self._resolve_url(endpoint_path)
 
-        if endpoint_path.startswith(self.url_api_path):
-            url = f"{self.url_base}{endpoint_path}"
-        else:
-            url = f"{self.url_base}{self.url_api_path}{endpoint_path}"
-
-        response = self.session.get(url, verify=self.verify_ssl)
+        response = self._call("GET", url)
         response.raise_for_status()
-        response_json = response.json()
+        response_json = _json_loads(response.content)
         return response_json
 
-    def http_get_all(self, endpoint_path: str) -> List[Dict]:
+    def http_iter(self, endpoint_path: str, params: Union[Dict, None] = None) -> Iterator[Dict]:
         """
-        Returns data from the GET request. Handles pagination internally to return all data at once.
+        Yields data objects from the GET request one at a time. Handles pagination internally.
+
+        Once the first page arrives and the server reports the total count, the remaining pages are fetched
+        concurrently (up to `page_workers` at a time); otherwise the server's 'next' links are followed one page at
+        a time. Either way the objects are yielded in the order the server returns them.
 
         Args:
             endpoint_path (str): The API endpoint path (e.g., '/networks' or 'networks'). Leading '/' is optional; it will be
             added automatically if needed.
+            params (dict, optional): Query parameters to add to the request, e.g. `{'filter': "name:eq('internal')"}`.
+                Values are URL-encoded, so they may contain spaces, quotes, etc. Defaults to None.
 
         Returns:
-            List[Dict]: A combined list of all data objects from all pages of results
+            Iterator[Dict]: An iterator over all data objects from all pages of results
 
         Raises:
+            ValueError: If given an absolute URL that is not on the BAM server
             RuntimeError: If called before logging in
+            bluecat_bam_tools.exceptions.CircuitOpenError: If recent calls to the server have failed repeatedly
             requests.exceptions.HTTPError: If the server returns an error response
             TypeError: If the response data is not in the expected format
             AssertionError: If the response doesn't contain the expected structure
         """
+        # Not a generator itself, so that calling before login() raises immediately rather than on first iteration.
         if not self.logged_in:
             raise RuntimeError("You must call login() before using this method.")
 
-        if not endpoint_path.startswith('/'):
-            endpoint_path = f"/{endpoint_path}"
+        url = self._resolve_url(endpoint_path)
+        params = dict(params or {})
 
-        if endpoint_path.startswith(self.url_api_path):
-            url = f"{self.url_base}{endpoint_path}"
-        else:
-            url = f"{self.url_base}{self.url_api_path}{endpoint_path}"
+        # Ask for large pages to cut down on round trips. Only the initial URL needs this; the server's 'next'
+        # links already carry the limit forward. Also ask for the total count, which lets _iter_pages() fetch the
+        # remaining pages concurrently by offset once the first page has arrived.
+        query = {**parse_qs(urlsplit(url).query), **params}
+        if 'limit' not in query:
+            params['limit'] = self.page_size
+        if self.page_workers > 1 and 'offset' not in query and 'total' not in query:
+            params['total'] = 'true'
 
-        all_data = []
-        while url:
-            response = self.session.get(url, verify=self.verify_ssl)
-            response.raise_for_status()
-            response_json = response.json()
+        # Encode the parameters into the URL once, rather than passing params= on every request: the offset URLs
+        # in _iter_pages() are built from this URL, so they carry the same parameters.
+        if params:
+            separator = '&' if '?' in url else '?'
+            url = f"{url}{separator}{urlencode(params)}"
 
-            # When the response_json is not paginated, the BAM returns a dict with 2 items, 'count' and 'data'
-            # where response_json['count'] == len(response_json['data'])
-            # When the response_json is paginated, it also includes '_links' in the response_json
+        return self._iter_pages(url)
 
-            if not ('count' in response_json):
-                raise RuntimeError("'count' not found in response_json")
+    def _get_page(self, url: str) -> Dict:
+        response = self._call("GET", url)
+        response.raise_for_status()
+        response_json = _json_loads(response.content)
 
-            # If response_json['count'] == 0, I don't know if 'data' will be present, Null, empty list, empty dict,
-            # or what. But I don't care. I'm done.
-            if response_json['count'] == 0:
-                return all_data
+        # When the response_json is not paginated, the BAM returns a dict with 2 items, 'count' and 'data'
+        # where response_json['count'] == len(response_json['data'])
+        # When the response_json is paginated, it also includes '_links' in the response_json
 
-            data = response_json['data']
-            if not isinstance(data, list):
-                raise TypeError(f"Expected 'data' to be a list, got {type(data).__name__}. Please report this " + \
-                    "issue. It should be easy to extend the code to handle this case.")
+        if not ('count' in response_json):
+            raise RuntimeError("'count' not found in response_json")
 
-            all_data.extend(data)
+        return response_json
 
-            # If a next url was received for pagination continuation, get it.
-            url = response_json.get('_links', {}).get('next', {}).get('href')
+    def _page_data(self, response_json: Dict) -> List[Dict]:
+        # If response_json['count'] == 0, I don't know if 'data' will be present, Null, empty list, empty dict,
+        # or what. But I don't care. I'm done.
+        if response_json['count'] == 0:
+            return []
+
+        data = response_json['data']
+        if not isinstance(data, list):
+            raise TypeError(f"Expected 'data' to be a list, got {type(data).__name__}. Please report this " + \
+                "issue. It should be easy to extend the code to handle this case.")
+        return data
+
+    def _next_url(self, response_json: Dict) -> Union[str, None]:
+        # If a next url was received for pagination continuation, get it.
+        url = response_json.get('_links', {}).get('next', {}).get('href')
+
+        # I don't know if it starts with 'http' or '/' or what. urljoin handles all those cases so we
+        # don't need to think about it. _resolve_url() then makes sure the link stays on the BAM server.
+        if url:
+            url = self._resolve_url(urljoin(self._url_root, url))
+        return url
+
+    def _offset_urls(self, url: str, first_page: Dict, first_page_size: int) -> List[str]:
+        """
+        Builds the URLs of every page after the first, when the server reported a totalCount. Returns an empty list
+        when that isn't possible, e.g. the server didn't report a total or the caller supplied their own offset.
 
-            # I don't know if it starts with 'http' or '/' or what. Just handle all those cases so we
-            # don't need to think about it.
-            if url:
-                if not url.startswith('http'):
-                    if url.startswith('/'):
-                        url = f"https://{self.hostname}{url}"
-                    else:
-                        url = f"https://{self.hostname}/{url}"
+        The stride is the number of objects the server actually returned on the first page. If that is less than the
+        limit we asked for, the server caps its page size, and it's not safe to assume later pages will hold the same
+        number, so this returns an empty list and the caller follows the server's 'next' links instead.
+        """
+        total = first_page.get('totalCount')
+        query = parse_qs(urlsplit(url).query)
+        if not isinstance(total, int) or 'offset' in query:
+            return []
+
+        if first_page_size < int(query['limit'][0]):
+            return []
+        return [f"{url}&offset={offset}" for offset in range(first_page_size, total, first_page_size)]
+
+    def _iter_pages(self, url: str) -> Iterator[Dict]:
+        response_json = self._get_page(url)
+        data = self._page_data(response_json)
+        yield from data
+
+        next_url = self._next_url(response_json)
+        if not data or not next_url:
+            return
+
+        # The total is known, so fetch the remaining pages concurrently over the pooled connections. Pages are
+        # consumed in submission order, so the objects come out in the same order as the server sent them.
+        offset_urls = self._offset_urls(url, response_json, len(data)) if self.page_workers > 1 else []
+        if offset_urls:
+            max_workers = min(self.page_workers, self.pool_maxsize, len(offset_urls))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Only keep max_workers pages in flight (or parsed and waiting), rather than submitting every page up
+                # front. Peak memory stays at a few pages even when the consumer is slower than the network, and a
+                # consumer that stops early (e.g. islice) wastes at most that many requests.
+                pending = deque()
+                try:
+                    for offset_url in offset_urls:
+                        if len(pending) >= max_workers:
+                            yield from self._page_data(pending.popleft().result())
+                        pending.append(executor.submit(self._get_page, offset_url))
+                    while pending:
+                        yield from self._page_data(pending.popleft().result())
+                finally:
+                    for future in pending:
+                        future.cancel()
+            return
+
+        # Otherwise follow the server's 'next' links one page at a time
+        url = next_url
+        while url:
+            response_json = self._get_page(url)
+            data = self._page_data(response_json)
+            if not data:
+                return
+            url = self._next_url(response_json)
+            yield from data
+
+    def http_get_all(self, endpoint_path: str, params: Union[Dict, None] = None) -> List[Dict]:
+        """
+        Returns data from the GET request. Handles pagination internally to return all data at once.
 
-        return all_data
+        For large result sets, prefer `http_iter()`, which yields the same objects without holding every page in memory.
+
+        Args:
+            endpoint_path (str): The API endpoint path (e.g., '/networks' or 'networks'). Leading '/' is optional; it will be
+            added automatically if needed.
+            params (dict, optional): Query parameters to add to the request, e.g. `{'filter': "name:eq('internal')"}`.
+                Values are URL-encoded, so they may contain spaces, quotes, etc. Defaults to None.
+
+        Returns:
+            List[Dict]: A combined list of all data objects from all pages of results
+
+        Raises:
+            ValueError: If given an absolute URL that is not on the BAM server
+            RuntimeError: If called before logging in
+            bluecat_bam_tools.exceptions.CircuitOpenError: If recent calls to the server have failed repeatedly
+            requests.exceptions.HTTPError: If the server returns an error response
+            TypeError: If the response data is not in the expected format
+            AssertionError: If the response doesn't contain the expected structure
+        """
+        return list(self.http_iter(endpoint_path, params=params))
 
     def get_network_by_cidr(self, target_cidr: str) -> Union[Dict, None]:
         """Find a network by its CIDR notation.
 
+        Networks that are found are cached for the rest of the session, so repeated lookups of the same CIDR don't
+        go back to the server. The cache is cleared on logout().
+
         Args:
             target_cidr (str): The CIDR notation to search for (e.g., '10.0.0.0/24')
 
@@ -264,8 +608,12 @@ class BluecatClient:
             ValueError: If multiple networks match the CIDR (which should not happen)
             RuntimeError: If called before logging in
         """
-        endpoint_path = f"/networks?filter=range:eq('{target_cidr}')"
-        response = self.http_get_all(endpoint_path)
+        network = self._network_cache.get(target_cidr)
+        if network is not None:
+            # Hand out a copy, so callers mutating the result can't corrupt the cache
+            return copy.deepcopy(network)
+
+        response = self.http_get_all('/networks', params={'filter': f"range:eq('{target_cidr}')"})
 
         if len(response) == 0:
             return None
@@ -273,7 +621,8 @@ class BluecatClient:
         if len(response) != 1:
             raise ValueError(f"Expected 1 network, got {len(response)}")
 
-        return response[0]
+        self._network_cache[target_cidr] = response[0]
+        return copy.deepcopy(response[0])
 
     def get_cidr_contains_ip(self, ip_address: str) -> Union[str, None]:
         """Find a network that contains the specified IP address.
@@ -288,54 +637,202 @@ class BluecatClient:
             ValueError: If there isn't exactly 1 network that contains the IP address
             RuntimeError: If called before logging in
         """
-        endpoint_path = f"/networks?filter=range:contains('{ip_address}')"
-        response = self.http_get_all(endpoint_path)
+        # Only the range is returned, so ask the server for nothing more. Use get_network_containing_ip() when you
+        # need the whole network object.
+        response = self.http_get_all(
+            '/networks', params={'fields': 'id,range', 'filter': f"range:contains('{ip_address}')"}
+        )
 
         if len(response) != 1:
             raise ValueError(f"Expected 1 network, got {len(response)}")
 
         return response[0]['range']
 
-    def get_unassigned_addresses_in_network_by_cidr(self, target_cidr: str) -> List[dict]:
+    def get_network_containing_ip(self, ip_address: str) -> Dict:
+        """Find the network that contains the specified IP address, and return the full network object.
+
+        The network is also cached under its CIDR, so a following `get_network_by_cidr()` or
+        `get_unassigned_addresses_in_network_by_cidr()` for the same network doesn't go back to the server.
+
+        Args:
+            ip_address (str): The IP address to search for (e.g., '10.0.0.15')
+
+        Returns:
+            dict: The network object, including its 'id' and its cidr 'range' (e.g., '10.0.0.0/24')
+
+        Raises:
+            ValueError: If there isn't exactly 1 network that contains the IP address
+            RuntimeError: If called before logging in
+        """
+        response = self.http_get_all('/networks', params={'filter': f"range:contains('{ip_address}')"})
+
+        if len(response) != 1:
+            raise ValueError(f"Expected 1 network, got {len(response)}")
+
+        network = response[0]
+        self._network_cache[network['range']] = network
+        return copy.deepcopy(network)
+
+    def get_unassigned_addresses_in_network_by_cidr(self, target_cidr: str, skip_first: int = 0,
+                                                    limit: Union[int, None] = None) -> List[dict]:
         """
         Retrieves a list of unassigned IP addresses within a network identified by CIDR notation.
 
+        This looks the network up with `get_network_by_cidr()` and then calls `get_unassigned_addresses_in_network()`.
+        If you already have the network object, call that directly to skip the lookup.
+
+        Args:
+            target_cidr (str): The CIDR notation of the network to search within (e.g., '10.0.0.0/24')
+            skip_first (int, optional): See `get_unassigned_addresses_in_network()`. Defaults to 0.
+            limit (int | None, optional): See `get_unassigned_addresses_in_network()`. Defaults to None.
+
+        Returns:
+            list[dict]: A list of address objects that are considered unassigned, each is a `dict` containing
+                      details like 'id', 'properties', 'name', 'type', etc. Addresses in the UNASSIGNED state come
+                      first, followed by the orphaned STATIC addresses.
+
+        Raises:
+            TypeError: If skip_first or limit is not an integer
+            ValueError: If skip_first or limit is negative, the network cannot be found, or multiple networks match
+                the CIDR
+            RuntimeError: If called before logging in
+        """
+        return self.get_network_and_unassigned(target_cidr, skip_first=skip_first, limit=limit)[1]
+
+    def get_network_and_unassigned(self, target_cidr: str, skip_first: int = 0,
+                                   limit: Union[int, None] = None) -> Tuple[Dict, List[dict]]:
+        """
+        Looks up a network by CIDR notation and retrieves its unassigned IP addresses, returning both.
+
+        This saves callers who need the network object as well as its free addresses from looking the network up
+        twice: the network is resolved once (or taken from the cache, see `get_network_by_cidr()`), and the addresses
+        are then queried by the network's id.
+
+        Args:
+            target_cidr (str): The CIDR notation of the network (e.g., '10.0.0.0/24')
+            skip_first (int, optional): See `get_unassigned_addresses_in_network()`. Defaults to 0.
+            limit (int | None, optional): See `get_unassigned_addresses_in_network()`. Defaults to None.
+
+        Returns:
+            tuple[dict, list[dict]]: The network object, and the list of address objects that are considered
+                unassigned, as returned by `get_unassigned_addresses_in_network()`
+
+        Raises:
+            TypeError: If skip_first or limit is not an integer
+            ValueError: If skip_first or limit is negative, the network cannot be found, or multiple networks match
+                the CIDR
+            RuntimeError: If called before logging in
+        """
+        network = self.get_network_by_cidr(target_cidr)
+        if network is None:
+            raise ValueError(f"Network {target_cidr} not found")
+        return network, self.get_unassigned_addresses_in_network(network, skip_first=skip_first, limit=limit)
+
+    def get_unassigned_addresses_in_network(self, network: Dict, skip_first: int = 0,
+                                            limit: Union[int, None] = None) -> List[dict]:
+        """
+        Retrieves a list of unassigned IP addresses within a network object, as returned by e.g.
+        `get_network_by_cidr()` or `get_network_containing_ip()`.
+
         This method looks for both explicitly unassigned addresses (state='UNASSIGNED') and
         static addresses with no associated resource records, which are effectively unassigned.
         The latter case handles situations where users delete DNS records but neglect
         the checkbox "Delete linked IP addresses if orphaned" in the web UI
 
         Args:
-            target_cidr (str): The CIDR notation of the network to search within (e.g., '10.0.0.0/24')
+            network (dict): The network object to search within. Only its 'id' and 'range' are used.
+            skip_first (int, optional): Ignore this many addresses at the start of the network, e.g. 30 to leave
+                '10.0.0.0' through '10.0.0.29' reserved for network equipment. The server filters them out, so they
+                are never downloaded. Defaults to 0.
+            limit (int | None, optional): Stop after finding this many unassigned addresses. No further pages are
+                requested once the limit is reached. Defaults to None, meaning no limit.
 
         Returns:
             list[dict]: A list of address objects that are considered unassigned, each is a `dict` containing
-                      details like 'id', 'properties', 'name', 'type', etc.
+                      details like 'id', 'properties', 'name', 'type', etc. Addresses in the UNASSIGNED state come
+                      first, followed by the orphaned STATIC addresses.
 
         Raises:
-            ValueError: If the network cannot be found or if multiple networks match the CIDR
+            TypeError: If network is not a dict, or skip_first or limit is not an integer
+            ValueError: If skip_first or limit is negative
             RuntimeError: If called before logging in
         """
-        unassigned_addresses = []
+        if not isinstance(network, dict):
+            raise TypeError("network must be a dict")
+        if isinstance(skip_first, bool) or not isinstance(skip_first, int):
+            raise TypeError("skip_first must be an integer")
+        if skip_first < 0:
+            raise ValueError("skip_first must not be negative")
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int)):
+            raise TypeError("limit must be an integer or None")
+        if limit is not None and limit < 0:
+            raise ValueError("limit must not be negative")
+
+        addresses_path = f"/networks/{network['id']}/addresses"
+
+        address_filter = ""
+        if skip_first:
+            ip_network = ipaddress.ip_network(network['range'], strict=False)
+            if skip_first >= ip_network.num_addresses:
+                return []
+            first_allowed = ip_network.network_address + skip_first
+            address_filter = f" and address:ge('{first_allowed}')"
+
+        # UNASSIGNED addresses always qualify, so fetch them without embedding their (empty) resourceRecords
+        unassigned_addresses = self.http_iter(
+            addresses_path, params={'filter': f"state:eq('UNASSIGNED'){address_filter}"}
+        )
+
+        # If there are no resourceRecords (dns entries pointed at this ip address), consider it to be
+        # unassigned, even if its state is not "UNASSIGNED". This is because users often delete names
+        # and neglect the checkbox "Delete linked IP addresses if orphaned." In the web UI, these appear
+        # as IP addresses with no names, but the status icon is still blue instead of gray.
+        static_addresses = self.http_iter(
+            addresses_path, params={'fields': 'embed(resourceRecords)', 'filter': f"state:eq('STATIC'){address_filter}"}
+        )
+        orphaned_static_addresses = (
+            address for address in static_addresses if len(address['_embedded']['resourceRecords']) == 0
+        )
+
+        # Both scans are lazy, so stopping at the limit also stops paginating (and skips the STATIC scan entirely
+        # if enough UNASSIGNED addresses were found).
+        return list(islice(chain(unassigned_addresses, orphaned_static_addresses), limit))
+
+    def get_unassigned_addresses_in_networks(self, target_cidrs: List[str]) -> Dict[str, List[dict]]:
+        """
+        Retrieves the unassigned IP addresses of several networks at once, by running
+        `get_unassigned_addresses_in_network_by_cidr()` for each CIDR concurrently.
 
-        network = self.get_network_by_cidr(target_cidr)
+        Each network's scan is independent, so the scans run in a thread pool sized to the connection pool
+        (`pool_maxsize`), overlapping their round trips on the shared keep-alive connections.
 
-        endpoint_path = f"/networks/{network['id']}/addresses?fields=embed(resourceRecords)&filter=state:eq('UNASSIGNED') or state:eq('STATIC')"
-        addresses = self.http_get_all(endpoint_path)
+        Args:
+            target_cidrs (List[str]): The CIDR notations of the networks to search within (e.g., ['10.0.0.0/24'])
 
-        for address in addresses:
-            if address['state'] == 'UNASSIGNED':
-                unassigned_addresses.append(address)
-                continue
-            if address['state'] == 'STATIC':
-                # If there are no resourceRecords (dns entries pointed at this ip address), consider it to be
-                # unassigned, even if its state is not "UNASSIGNED". This is because users often delete names
-                # and neglect the checkbox "Delete linked IP addresses if orphaned." In the web UI, these appear
-                # as IP addresses with no names, but the status icon is still blue instead of gray.
-                if len(address['_embedded']['resourceRecords']) == 0:
-                    unassigned_addresses.append(address)
+        Returns:
+            Dict[str, List[dict]]: Maps each CIDR to its list of unassigned address objects, in the same order as
+                `target_cidrs`
 
-        return unassigned_addresses
+        Raises:
+            TypeError: If target_cidrs is not a list of strings
+            ValueError: If a network cannot be found or if multiple networks match a CIDR
+            RuntimeError: If called before logging in
+            bluecat_bam_tools.exceptions.CircuitOpenError: If recent calls to the server have failed repeatedly
+            requests.exceptions.HTTPError: If the server returns an error response
+        """
+        if not isinstance(target_cidrs, list):
+            raise TypeError("target_cidrs must be a list of strings")
+        if not all(isinstance(cidr, str) for cidr in target_cidrs):
+            raise TypeError("all items in target_cidrs must be strings")
+        if not self.logged_in:
+            raise RuntimeError("You must call login() before using this method.")
+        if not target_cidrs:
+            return {}
+
+        max_workers = min(len(target_cidrs), self.pool_maxsize)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.get_unassigned_addresses_in_network_by_cidr, target_cidrs)
+            return dict(zip(target_cidrs, results))
 
     def get_view(self, view_name: str) -> Union[dict, None]:
         """
@@ -352,7 +849,7 @@ class BluecatClient:
             AssertionError: If server response is not as expected
             RuntimeError: If called before logging in
         """
-        view = self.http_get_all(f"/views?filter=name:eq('{view_name}')")
+        view = self.http_get_all('/views', params={'filter': f"name:eq('{view_name}')"})
         if not view:
             return None
         if len(view) != 1:
@@ -363,6 +860,11 @@ class BluecatClient:
         """
         Find the parent zone by progressively removing sections from the hostname.
 
+        All candidate names (e.g. 'a.b.example.com', 'b.example.com', 'example.com') are looked up in a single query,
+        and the longest one that exists as a zone wins. Each candidate's result, found or not, is cached for the rest
+        of the session, so creating many records under the same zone only looks up the names not seen before. The
+        cache is cleared on logout().
+
         Args:
             fqdn (str): The fully qualified domain name (FQDN) to find the parent zone of
 
@@ -372,16 +874,48 @@ class BluecatClient:
         """
         name_parts = fqdn.split('.')
 
-        # Start with the full hostname and progressively remove sections from the beginning
-        while len(name_parts) > 1:  # Keep at least one part (TLD)
-            search_name = '.'.join(name_parts)
-            zones = self.http_get_all(f"zones?filter=absoluteName:eq('{search_name}')")
-
-            if zones:
-                return zones
+        # Start with the full hostname and progressively remove sections from the beginning.
+        # Keep at least two parts; the TLD alone is never a candidate.
+        candidates = ['.'.join(name_parts[i:]) for i in range(len(name_parts) - 1)]
+        if not candidates:
+            return None
 
-            # Remove the leftmost part and try again
-            name_parts.pop(0)
+        def lookup(names):
+            name_filter = ' or '.join(f"absoluteName:eq('{name}')" for name in names)
+            return self.http_get_all('/zones', params={'filter': name_filter})
+
+        # Only look up candidates not already cached. Once we reach a candidate known to be a zone, shorter ones
+        # can't be the closest parent, so there's no need to look them up.
+        uncached = []
+        for candidate in candidates:
+            cached_zones = self._zone_cache.get(candidate.lower())
+            if cached_zones:
+                break
+            if cached_zones is None:
+                uncached.append(candidate)
+
+        if uncached:
+            # One OR-filter query instead of a round trip per candidate. Unusually deep names are split into groups
+            # of 8 candidates, to keep the filter a reasonable length, and the groups are looked up concurrently.
+            groups = [uncached[i:i + 8] for i in range(0, len(uncached), 8)]
+            if len(groups) == 1:
+                zones = lookup(groups[0])
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(groups), self.pool_maxsize)) as executor:
+                    zones = [zone for group_zones in executor.map(lookup, groups) for zone in group_zones]
+
+            # Cache misses too (as an empty list), so the same non-zone name isn't looked up again
+            for candidate in uncached:
+                self._zone_cache[candidate.lower()] = [
+                    zone for zone in zones if zone['absoluteName'].lower() == candidate.lower()
+                ]
+
+        # The longest candidate that exists is the closest parent
+        for candidate in candidates:
+            parent_zones = self._zone_cache.get(candidate.lower())
+            if parent_zones:
+                # Hand out a copy, so callers mutating the result can't corrupt the cache
+                return copy.deepcopy(parent_zones)
 
         return None
 
@@ -401,6 +935,7 @@ class BluecatClient:
         Raises:
             TypeError: If any parameter is of incorrect type
             ValueError: If views list is empty, ipaddresses list is empty, or parent zone cannot be found
+            bluecat_bam_tools.exceptions.CircuitOpenError: If recent calls to the server have failed repeatedly
             requests.exceptions.HTTPError: If the server returns an error response
             RuntimeError: If called before logging in
         """
@@ -440,7 +975,17 @@ class BluecatClient:
         if len(zones) == 0:
             raise ValueError(f"Parent zone for {fqdn} does not exist in views {views}")
 
-        relative_domain_name = fqdn.rstrip(f".{zones[0]['absoluteName']}")
+        # The record name is relative to the zone, e.g. 'host' for 'host.example.com' in zone 'example.com', and ''
+        # (the zone apex) for 'example.com' itself. (Not str.rstrip, which strips a set of characters rather than a
+        # suffix: 'mail.example.com' would lose the trailing 'l' along with '.example.com'.)
+        zone_name = zones[0]['absoluteName']
+        zone_suffix = f".{zone_name}"
+        if fqdn.lower() == zone_name.lower():
+            relative_domain_name = ''
+        elif fqdn.lower().endswith(zone_suffix.lower()):
+            relative_domain_name = fqdn[:-len(zone_suffix)]
+        else:
+            relative_domain_name = fqdn
 
         # Create data object for POST based on the provided ipaddresses
         addresses = []
@@ -458,14 +1003,31 @@ class BluecatClient:
             "addresses": addresses
         }
 
-        # Make a local copy of session headers and add change control comment if provided
-        headers = self.session.headers.copy()
-        if change_control_comment:
-            headers["x-bcn-change-control-comment"] = change_control_comment
+        # The body is identical for every zone, so serialize it once
+        body = _json_dumps(data)
+
+        # requests merges per-call headers over the session headers, so only pass the change control comment
+        headers = {"x-bcn-change-control-comment": change_control_comment} if change_control_comment else None
+
+        def zone_url(zone):
+            return f"{self.url_base}{self.url_api_path}/zones/{zone['id']}/resourceRecords"
+
+        # Everything but the URL is the same for every zone, so prepare the request (header merging, body) and
+        # resolve the environment settings once, then only swap the URL per zone.
+        prepared = self.session.prepare_request(requests.Request("POST", zone_url(zones[0]), data=body, headers=headers))
+        send_settings = self.session.merge_environment_settings(prepared.url, {}, None, self.verify_ssl, None)
+
+        def post_record(zone):
+            zone_request = prepared.copy()
+            zone_request.prepare_url(zone_url(zone), None)
+            return self._send(zone_request, **send_settings)
+
+        # Each view's zone is independent, so create the record in all of them concurrently. Every POST finishes
+        # before any error is raised.
+        with ThreadPoolExecutor(max_workers=min(8, len(zones), self.pool_maxsize)) as executor:
+            responses = list(executor.map(post_record, zones))
 
-        for zone in zones:
-            endpoint_path = f"{self.url_base}{self.url_api_path}/zones/{zone['id']}/resourceRecords"
-            response = self.session.post(endpoint_path, json=data, headers=headers, verify=self.verify_ssl)
+        for response in responses:
             response.raise_for_status()
 
         return True
@@ -1,2 +1,6 @@
 class LoginError(Exception):
     pass
+
+
+class CircuitOpenError(Exception):
+    pass
@@ -1,49 +1,170 @@
+import os
 import sys
-import argparse
+import functools
 import getpass
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from requests.exceptions import ConnectionError, Timeout, HTTPError, RequestException
 
 from bluecat_bam_tools.bluecat_client import BluecatClient
 
-try:
-    import yaml
-except ImportError:
-    print("Error: PyYAML package is required for sandbox.py")
-    print("Please install it with: pip install PyYAML")
-    sys.exit(1)
-
-try:
-    import keyring
-except ImportError:
-    print("Error: The keyring package is required but not installed")
-    print("")
-    print("This script uses keyring to securely store and retrieve credentials.")
-    print("Install the package with: pip install keyring")
-    print("")
-    print("For additional options:")
-    print("  - For password manager integration (Bitwarden, 1Password, etc.):")
-    print("    https://keyring.readthedocs.io/en/latest/#third-party-backends")
-    print("")
-    print("  - For headless servers or automated environments:")
-    print("    pip install keyring keyrings.alt")
-    print("")
-    sys.exit(1)
+# yaml and keyring are imported on first use rather than at the top, so e.g. --help doesn't pay for loading the
+# libyaml extension or for keyring's backend discovery.
+def import_yaml():
+    """Import PyYAML, or exit with instructions if it's not installed"""
+    try:
+        import yaml
+    except ImportError:
+        print("Error: PyYAML package is required for sandbox.py")
+        print("Please install it with: pip install PyYAML")
+        sys.exit(1)
+    return yaml
 
 
-def get_password(hostname, username, save_password=False):
-    """Get password from keyring or prompt user if needed"""
+def import_keyring():
+    """Import keyring, or exit with instructions if it's not installed"""
+    try:
+        import keyring
+    except ImportError:
+        print("Error: The keyring package is required but not installed")
+        print("")
+        print("This script uses keyring to securely store and retrieve credentials.")
+        print("Install the package with: pip install keyring")
+        print("")
+        print("For additional options:")
+        print("  - For password manager integration (Bitwarden, 1Password, etc.):")
+        print("    https://keyring.readthedocs.io/en/latest/#third-party-backends")
+        print("")
+        print("  - For headless servers or automated environments:")
+        print("    pip install keyring keyrings.alt")
+        print("")
+        sys.exit(1)
+    return keyring
+
+
+# The keyring backend, once discovered by get_keyring_backend()
+_KEYRING = None
+
+
+def get_keyring_backend():
+    """Return the keyring backend, discovering it (dbus, Keychain, ...) on first use only"""
+    global _KEYRING
+    if _KEYRING is None:
+        _KEYRING = import_keyring().get_keyring()
+    return _KEYRING
+
+
+def warm_keyring():
+    """Import keyring and let it pick its backend, so the first password lookup doesn't wait for it"""
+    # A plain import first: if keyring is missing, leave reporting that to get_password() on the main thread
+    try:
+        import keyring  # noqa: F401
+        get_keyring_backend()
+    except Exception:
+        pass
+
+
+def load_config(path):
+    """Load the YAML config, reusing a JSON copy from the last run if the file hasn't changed since"""
+    cache_path = f"{path}.cache"
+
+    # The config is tiny, so read it straight from the file descriptor rather than through open()'s buffer layers.
+    # Taking the cache key from fstat() of the same descriptor ensures it describes the bytes we read.
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        stat = os.fstat(fd)
+        cache_key = [stat.st_mtime_ns, stat.st_size]
+
+        # The cache is JSON, not pickle: anyone able to drop a file next to the config must not be able to run code
+        # in a process that handles keyring credentials.
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                cached = json.load(cache_file)
+            if isinstance(cached, dict) and cached.get('key') == cache_key:
+                return cached['config']
+        except (OSError, ValueError, KeyError):
+            pass  # no usable cache; parse the YAML below
+
+        chunks = []
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+    yaml = import_yaml()
+    # Prefer the libyaml C parser when PyYAML was built with it; it parses the same YAML much faster.
+    # It takes the bytes as they are and detects the encoding itself.
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        config = yaml.load(b''.join(chunks), Loader=loader)
+    except yaml.YAMLError as e:
+        # e only knows it parsed "<byte string>", so name the file here
+        print(f"Error parsing YAML configuration in {path}: {e}")
+        sys.exit(1)
+
+    # Only cache a config that survives the JSON round trip unchanged (e.g. no YAML dates or non-string keys).
+    try:
+        cache_text = json.dumps({'key': cache_key, 'config': config})
+    except (TypeError, ValueError):
+        return config
+    if json.loads(cache_text)['config'] != config:
+        return config
+
+    # Write to a temporary file and rename it into place, so a concurrent run never reads a half-written cache.
+    # The cache is only an optimization, so failing to write it (e.g. read-only directory) is not an error.
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w') as cache_file:
+            cache_file.write(cache_text)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    return config
+
+
+# Passwords already read from the keyring, so repeated lookups (e.g. a loop over hosts) skip the backend's IPC
+# round trip. Entries are trusted for PASSWORD_CACHE_SECONDS, after which the keyring is asked again.
+PASSWORD_CACHE_SECONDS = 300
+_password_cache = {}
+
 
+def _load_password(service_name, username):
+    """Get password from keyring, or from the in-process cache if it was read recently"""
+    cached = _password_cache.get((service_name, username))
+    if cached is not None:
+        loaded_at, password = cached
+        if time.monotonic() - loaded_at < PASSWORD_CACHE_SECONDS:
+            return password
+
+    password = get_keyring_backend().get_password(service_name, username)
+    if password:
+        _password_cache[(service_name, username)] = (time.monotonic(), password)
+    return password
+
+
+@functools.cache
+def _service_name(hostname):
     # service_name should be something unique to your application, and also unique to your hostname
-    service_name = f"bluecat-bam-tools-{hostname}"
+    return f"bluecat-bam-tools-{hostname}"
+
+
+def get_password(hostname, username, save_password=False):
+    """Get password from keyring or prompt user if needed"""
+    service_name = _service_name(hostname)
 
     if save_password:
         password = getpass.getpass(f"Enter password for {username}@{hostname}: ")
-        keyring.set_password(service_name, username, password)
+        get_keyring_backend().set_password(service_name, username, password)
+        _password_cache.pop((service_name, username), None)
         print(f"Password saved in keyring for {username}@{hostname}")
 
-    password = keyring.get_password(service_name, username)
+    password = _load_password(service_name, username)
 
     if not password:
         print(f"No password found in keyring for {username}@{hostname}")
@@ -53,42 +174,52 @@ def get_password(hostname, username, save_password=False):
     return password
 
 
-def parse_args():
-    """Parse command line arguments"""
-    parser = argparse.ArgumentParser(description="Sandbox script for testing BluecatClient functionality")
+def validate_ipv4_address(address):
+    """Return True if address looks like an IPv4 address, e.g. '10.10.10.10', so a typo doesn't cost a round trip"""
+    octets = address.split('.')
+    if len(octets) != 4:
+        return False
+    return all(octet.isascii() and octet.isdigit() and int(octet) <= 255 for octet in octets)
 
-    # "store_true" means if "--save-password" was provided, `args.save_password` will be True.
-    # otherwise, it'll be False. The name "save_password" is automatically derived from the arg name.
-    parser.add_argument("--save-password", action="store_true", help="Save password in keyring")
-    return parser.parse_args()
 
+USAGE = """usage: sandbox.py [-h] [--save-password]
 
-def ipaddress_to_int(address_str: str):
-    ip_octets = [int(octet) for octet in address_str.split('.')]
-    ip_int = (ip_octets[0] << 24) + (ip_octets[1] << 16) + \
-             (ip_octets[2] << 8) + ip_octets[3]
-    return ip_int
+Sandbox script for testing BluecatClient functionality
 
+options:
+  -h, --help       show this help message and exit
+  --save-password  Save password in keyring"""
 
-def is_near_ipaddress(first_ipaddress: str, second_ipaddress: str, threshold: int) -> bool:
-    first_int = ipaddress_to_int(first_ipaddress)
-    second_int = ipaddress_to_int(second_ipaddress)
-    return abs(first_int - second_int) <= threshold
+
+def parse_args(argv):
+    """Parse command line arguments, returning save_password. There's only one flag, so argparse isn't needed."""
+    save_password = False
+    for arg in argv:
+        if arg in ('-h', '--help'):
+            print(USAGE)
+            sys.exit(0)
+        elif arg == '--save-password':
+            save_password = True
+        else:
+            print(f"usage: sandbox.py [-h] [--save-password]\nsandbox.py: error: unrecognized argument: {arg}",
+                  file=sys.stderr)
+            sys.exit(2)
+    return save_password
 
 
 def main():
-    args = parse_args()
+    save_password = parse_args(sys.argv[1:])
 
-    try:
-        with open('sandbox_config.yaml', 'r') as config_file:
-            config = yaml.safe_load(config_file)
-    except FileNotFoundError:
-        print("Error: sandbox_config.yaml not found")
-        print("Please copy sandbox_config_example.yaml to sandbox_config.yaml and update it")
-        sys.exit(1)
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML configuration: {e}")
-        sys.exit(1)
+    # Finding the keyring backend (dbus, Keychain, ...) doesn't depend on the config, so do it in the background
+    # while the config loads. The password itself has to wait, since the username comes from the config.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(warm_keyring)
+        try:
+            config = load_config('sandbox_config.yaml')
+        except FileNotFoundError:
+            print("Error: sandbox_config.yaml not found")
+            print("Please copy sandbox_config_example.yaml to sandbox_config.yaml and update it")
+            sys.exit(1)
 
     hostname = config.get('hostname')
     username = config.get('username')
@@ -99,69 +230,68 @@ def main():
         sys.exit(1)
 
     # Get password from keyring or prompt user
-    password = get_password(hostname, username, args.save_password)
-
-    with BluecatClient(hostname, username, password, verify_ssl=verify_ssl) as bam:
-        try:
-            bam.login()
-        except ConnectionError as e:
-            print("Error: Unable to connect to the server.", file=sys.stderr)
-            sys.exit(1)
-        except Timeout:
-            print("Error: Request timed out.", file=sys.stderr)
-            sys.exit(1)
-        except HTTPError as e:
-            print(f"HTTP error occurred: {e.response.status_code} - {e.response.reason}", file=sys.stderr)
-            sys.exit(1)
-        except RequestException as e:
-            print(f"An unexpected error occurred: {e}", file=sys.stderr)
-            sys.exit(1)
-        except json.JSONDecodeError as e:
-            print(f"Error decoding JSON response: {e}", file=sys.stderr)
-            sys.exit(1)
-
-        ip_address = '10.10.10.10'
-        cidr = bam.get_cidr_contains_ip(ip_address)
-        cidr_first_ipaddress = cidr.split('/')[0]
-
-        # Demonstrate get_network_by_cidr()
-        network = bam.get_network_by_cidr(cidr)
-        print("Found network:")
-        print(f"{network}")
-        print("")
+    password = get_password(hostname, username, save_password)
 
-        # Demonstrate get_unassigned_addresses_in_network_by_cidr()
-        unassigned_addresses = bam.get_unassigned_addresses_in_network_by_cidr(cidr)
-        if not unassigned_addresses:
-            print("No unassigned addresses found")
-        else:
-            print(f"Found {len(unassigned_addresses)} unassigned addresses in network {cidr}. Here's the first one:")
-            print(f"{unassigned_addresses[0]}")
-
-        # Demonstrate using some custom logic
-        found_free_ip_address = False
-        for unassigned_address in unassigned_addresses:
-            unassigned_address_str = unassigned_address['address']
-
-            # Enforce a policy that the first 30 IP addresses of any network will not be assigned; they are reserved
-            # for network equipment and such
-            if not is_near_ipaddress(unassigned_address_str, cidr_first_ipaddress, 30):
-                found_free_ip_address = True
-                break
-
-        if not found_free_ip_address:
-            raise RuntimeError("No unassigned addresses found in network")
-
-        # Now we've got an unassigned_address. Assign it.
-        # Demonstrate record_a_create()
-        fqdn = 'test.example.com'
-        zones = ['internal','external']
-        bam.record_a_create(zones, fqdn, unassigned_address_str)
-
-        # Demonstrate get_view()
-        view_internal = bam.get_view('internal')
-
-    print("Done")
+    # Results are collected here and written in one go, at the end or as soon as the run fails, so whatever was
+    # found before an error is still shown. Errors themselves go straight to stderr.
+    output = []
+    try:
+        with BluecatClient(hostname, username, password, verify_ssl=verify_ssl) as bam:
+            try:
+                bam.login()
+            except ConnectionError as e:
+                print("Error: Unable to connect to the server.", file=sys.stderr)
+                sys.exit(1)
+            except Timeout:
+                print("Error: Request timed out.", file=sys.stderr)
+                sys.exit(1)
+            except HTTPError as e:
+                print(f"HTTP error occurred: {e.response.status_code} - {e.response.reason}", file=sys.stderr)
+                sys.exit(1)
+            except RequestException as e:
+                print(f"An unexpected error occurred: {e}", file=sys.stderr)
+                sys.exit(1)
+            except json.JSONDecodeError as e:
+                print(f"Error decoding JSON response: {e}", file=sys.stderr)
+                sys.exit(1)
+
+            # Demonstrate get_network_containing_ip()
+            ip_address = '10.10.10.10'
+            if not validate_ipv4_address(ip_address):
+                print(f"Error: {ip_address} is not a valid IPv4 address", file=sys.stderr)
+                sys.exit(1)
+            network = bam.get_network_containing_ip(ip_address)
+            cidr = network['range']
+            output.append("Found network:")
+            output.append(f"{network}")
+            output.append("")
+
+            # Demonstrate get_unassigned_addresses_in_network()
+            # Enforce a policy that addresses within 30 of the network address (e.g. '10.10.10.0' through '10.10.10.30')
+            # will not be assigned; they are reserved for network equipment and such. That's 31 addresses, hence
+            # skip_first=31. The BAM filters those out for us, and we only need one free address.
+            # Passing the network object we already have avoids looking it up again by CIDR.
+            unassigned_addresses = bam.get_unassigned_addresses_in_network(network, skip_first=31, limit=1)
+            if not unassigned_addresses:
+                raise RuntimeError("No unassigned addresses found in network")
+
+            unassigned_address_str = unassigned_addresses[0]['address']
+            output.append(f"Found unassigned address {unassigned_address_str} in network {cidr}:")
+            output.append(f"{unassigned_addresses[0]}")
+
+            # Now we've got an unassigned_address. Assign it.
+            # Demonstrate record_a_create()
+            fqdn = 'test.example.com'
+            zones = ['internal','external']
+            bam.record_a_create(zones, fqdn, unassigned_address_str)
+
+            # Demonstrate get_view()
+            view_internal = bam.get_view('internal')
+
+        output.append("Done")
+    finally:
+        if output:
+            sys.stdout.write("\n".join(output) + "\n")
 
 
 if __name__ == "__main__":
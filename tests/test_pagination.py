@@ -0,0 +1,102 @@
+import json
+import threading
+import time
+import unittest
+from urllib.parse import urlsplit, parse_qs, urlencode
+
+import requests
+from requests.adapters import BaseAdapter
+
+from bluecat_bam_tools.bluecat_client import BluecatClient
+
+
+class FakeBamAdapter(BaseAdapter):
+    """
+    Serves GET /api/v2/networks from a list of `total` numbered objects, paginated like BAM: honors limit and offset,
+    reports totalCount when asked, and links to the next page. Returns at most `max_page_size` objects per page,
+    whatever limit the client asks for.
+    """
+
+    def __init__(self, total, max_page_size, delay=0.0):
+        super().__init__()
+        self.total = total
+        self.max_page_size = max_page_size
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self._respond(request)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _respond(self, request):
+        query = {key: values[0] for key, values in parse_qs(urlsplit(request.url).query).items()}
+        offset = int(query.get('offset', 0))
+        limit = min(int(query.get('limit', 10)), self.max_page_size)
+        data = [{'id': i} for i in range(offset, min(offset + limit, self.total))]
+
+        body = {'count': len(data), 'data': data}
+        if query.get('total') == 'true':
+            body['totalCount'] = self.total
+        if offset + limit < self.total:
+            next_query = {**query, 'offset': offset + limit}
+            next_query.pop('total', None)
+            body['_links'] = {'next': {'href': f"/api/v2/networks?{urlencode(next_query)}"}}
+
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(body).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def make_client(adapter, **kwargs):
+    bam = BluecatClient('bam.test', 'user', 'password', **kwargs)
+    bam.session.mount(bam._url_root, adapter)
+    bam.logged_in = True
+    return bam
+
+
+class PaginationTests(unittest.TestCase):
+
+    def test_all_pages_fetched_concurrently(self):
+        bam = make_client(FakeBamAdapter(total=2500, max_page_size=1000), page_size=100)
+        ids = [item['id'] for item in bam.http_iter('/networks')]
+        self.assertEqual(ids, list(range(2500)))
+
+    def test_server_capping_page_size(self):
+        # The server returns fewer objects per page than requested; no page may be skipped
+        for page_workers in (1, 8):
+            with self.subTest(page_workers=page_workers):
+                bam = make_client(FakeBamAdapter(total=2500, max_page_size=100), page_workers=page_workers)
+                ids = [item['id'] for item in bam.http_get_all('/networks')]
+                self.assertEqual(ids, list(range(2500)))
+
+    def test_concurrency_bounded_by_pool_maxsize(self):
+        # Scanning several networks at once, each paginating concurrently, must not exceed pool_maxsize requests
+        adapter = FakeBamAdapter(total=500, max_page_size=1000, delay=0.01)
+        bam = make_client(adapter, pool_maxsize=4, page_size=50, page_workers=8)
+
+        threads = [threading.Thread(target=bam.http_get_all, args=('/networks',)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertLessEqual(adapter.max_in_flight, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from requests.adapters import BaseAdapter
+from urllib3.util import Retry
+
+from bluecat_bam_tools.bluecat_client import BluecatClient
+from bluecat_bam_tools.exceptions import CircuitOpenError
+
+
+class AlwaysUnavailableHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(503)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RetryErrorAdapter(BaseAdapter):
+    """Raises RetryError on every request, as requests does when a Retry with raise_on_status=True runs out"""
+
+    def send(self, request, **kwargs):
+        raise requests.exceptions.RetryError("too many 503 error responses", request=request)
+
+    def close(self):
+        pass
+
+
+class RetryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), AlwaysUnavailableHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_client(self, **kwargs):
+        bam = BluecatClient('bam.test', 'user', 'password', **kwargs)
+        # Serve the client's adapter (and so its retry policy) over plain HTTP from the local server
+        bam.session.mount(self.url, bam.session.get_adapter(bam._url_root))
+        return bam
+
+    def test_caller_retry_returns_last_response(self):
+        retry = Retry(total=2, backoff_factor=0, status_forcelist=[502, 503, 504])
+        bam = self.make_client(max_retries=retry)
+
+        response = bam._call('GET', self.url)
+        self.assertEqual(response.status_code, 503)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            response.raise_for_status()
+
+    def test_exhausted_retries_trip_the_circuit_breaker(self):
+        retry = Retry(total=1, backoff_factor=0, status_forcelist=[503])
+        bam = self.make_client(max_retries=retry)
+
+        for _ in range(bam._circuit_breaker.failure_threshold):
+            bam._call('GET', self.url)
+        self.assertEqual(bam._circuit_breaker.state, 'OPEN')
+        with self.assertRaises(CircuitOpenError):
+            bam._call('GET', self.url)
+
+    def test_retry_error_counts_as_failure(self):
+        bam = BluecatClient('bam.test', 'user', 'password')
+        bam.session.mount(bam._url_root, RetryErrorAdapter())
+
+        for _ in range(bam._circuit_breaker.failure_threshold):
+            with self.assertRaises(requests.exceptions.RetryError):
+                bam._call('GET', f"{bam._url_root}api/v2/networks")
+        self.assertEqual(bam._circuit_breaker.state, 'OPEN')
+
+
+if __name__ == '__main__':
+    unittest.main()